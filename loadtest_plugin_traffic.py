@@ -0,0 +1,1254 @@
+#!/usr/bin/env python3
+"""Load-test harness that replays the WordPress plugin traffic against the backend.
+
+The PHP plugin (``includes/class-openwebui-user-sync.php``) never issues a
+single request per operation: every call walks a list of fallback endpoints
+(``/api/v1/...``, ``/api/...``, bare paths) and, for group memberships, a list
+of payload variants until one of them succeeds.  This script reproduces those
+call chains against the FastAPI application from ``app/backend/main.py``
+served by ``uvicorn`` (``--workers`` processes, launched as a subprocess) on
+a seeded SQLite fixture, with the ``JWTBearer`` dependency stubbed out.
+
+Scenarios replayed (weights are configurable with ``--mix``):
+
+* ``bulk_sync``: ``sync_user_ajax`` with ``sync_all``; signup fallbacks per
+  user, aborting after more than five failed users like the plugin does.
+* ``email_lookup``: ``get_openwebui_user_id_by_email`` fallbacks.
+* ``membership_add``: ``handle_ld_added_group_access``; email lookup when the
+  ``_openwebui_user_id`` meta is not cached, ``get_openwebui_group_by_name``
+  (cache, refresh, create) and ``add_remote_user_to_openwebui_group`` POST
+  fallbacks (endpoints x payload variants).
+* ``membership_remove``: ``handle_ld_removed_group_access``; same lookups,
+  then ``remove_remote_user_from_openwebui_group`` DELETE fallbacks, stopping
+  at the first 2xx or 404.
+* ``group_panel_add``: ``assign_group_members_ajax``; ``add_user_to_group``
+  with 9 email/username payloads x 5 endpoints per user.
+* ``group_panel_remove``: ``remove_group_members_ajax``; email lookup and
+  ``remove_user_from_group`` DELETE fallbacks per user.
+* ``groups_refresh``: ``sync_openwebui_groups_ajax`` cache refresh.
+
+The user meta and the groups cache are shared by all simulated clients, as
+they are persistent WordPress state.  Locally ``--cached-id-ratio`` of the
+seeded users start with a cached remote id; with ``--base-url`` nothing is
+cached and real users and groups are discovered first.  Users whose lookup
+fails are not picked again as membership targets.  ``--plugin-pacing``
+enables the plugin's ``sleep(1)`` pauses in bulk sync and the group panel.
+
+The report includes p50/p95/p99 latency per scenario and per endpoint, error
+rates and the event-loop lag sampled inside every server worker, which is the
+number to watch when deciding how many workers a release needs.  The server
+runs in its own processes, but the load generator still shares the machine's
+CPUs with it; the generator's own loop lag is reported so a saturated client
+can be told apart from a saturated server.  Like ``wp_remote_*``, every
+request opens a new connection unless ``--keep-alive`` is given.
+
+Local target limitation: ``app/backend/main.py`` only routes
+``GET /api/groups``.  It does not implement signup, user lookup or membership
+POST/DELETE, so locally every scenario except ``groups_refresh`` (and the
+group lookups inside the membership ones) only measures FastAPI's 404 path
+and the seeded ``users`` table is never read.  Use ``--base-url`` (plus ``--api-key``) to
+replay the same mix against a real OpenWebUI instance where those routes
+exist; ``bulk_sync`` then creates real accounts, so point it at staging.
+
+Requires ``fastapi``, ``httpx`` and ``uvicorn``.  Example::
+
+    python3 loadtest_plugin_traffic.py --concurrency 32 --duration 60 \\
+        --mix email_lookup=5,membership_add=3,groups_refresh=1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import random
+import signal
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+try:
+    import fastapi  # noqa: F401  # pylint: disable=unused-import
+    import httpx
+    import uvicorn
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    print(f"❌ ERROR: Falta una dependencia del harness de carga: {exc}")
+    print("   Instala fastapi, httpx y uvicorn en este entorno Python.")
+    sys.exit(1)
+
+
+REPO_ROOT = Path(__file__).resolve().parent
+
+# Same timeout as ``OPENWEBUI_API_TIMEOUT`` in ``openwebui-user-sync.php``.
+PLUGIN_API_TIMEOUT = 10.0
+
+# Endpoint fallback lists, copied in the order the plugin tries them.
+SIGNUP_ENDPOINTS = (
+    "/api/v1/auths/signup",
+    "/api/auths/signup",
+    "/auth/register",
+    "/api/auth/register",
+)
+EMAIL_LOOKUP_ENDPOINTS = (
+    "/api/v1/users?email={email}",
+    "/api/users?email={email}",
+    "/users?email={email}",
+)
+USER_LIST_ENDPOINTS = (
+    "/api/v1/users",
+    "/api/users",
+    "/users",
+)
+GROUPS_ENDPOINTS = (
+    "/api/v1/groups",
+    "/api/groups",
+    "/groups",
+    "/api/v1/admin/groups",
+)
+MEMBERSHIP_ADD_ENDPOINTS = (
+    "/api/v1/groups/{group_id}/members",
+    "/api/groups/{group_id}/members",
+    "/groups/{group_id}/members",
+    "/api/v1/groups/{group_id}/users",
+    "/api/groups/{group_id}/users",
+)
+MEMBERSHIP_REMOVE_ENDPOINTS = (
+    "/api/v1/groups/{group_id}/members/{user_id}",
+    "/api/groups/{group_id}/members/{user_id}",
+    "/groups/{group_id}/members/{user_id}",
+    "/api/v1/groups/{group_id}/users/{user_id}",
+    "/api/groups/{group_id}/users/{user_id}",
+)
+# ``add_user_to_group`` / ``remove_user_from_group`` (bulk group panel) use
+# their own orders and fewer DELETE candidates than the LearnDash hooks.
+GROUP_PANEL_ADD_ENDPOINTS = (
+    "/api/v1/groups/{group_id}/members",
+    "/api/groups/{group_id}/members",
+    "/api/v1/groups/{group_id}/users",
+    "/api/groups/{group_id}/users",
+    "/groups/{group_id}/members",
+)
+GROUP_PANEL_REMOVE_ENDPOINTS = (
+    "/api/v1/groups/{group_id}/members/{user_id}",
+    "/api/groups/{group_id}/members/{user_id}",
+    "/groups/{group_id}/members/{user_id}",
+)
+
+# Keywords used by ``is_duplicate_group_message`` in the plugin.
+DUPLICATE_KEYWORDS = ("already", "exists", "duplicate", "409", "member")
+
+LOCAL_TARGET_NOTE = (
+    "app/backend/main.py solo enruta GET /api/groups: el alta de usuarios, la "
+    "búsqueda por email y las altas/bajas en grupos solo miden la respuesta 404 del "
+    "router de FastAPI y la tabla users sembrada no se consulta. Usa --base-url "
+    "contra una instancia real de OpenWebUI para medir esas rutas."
+)
+
+DEFAULT_MIX = (
+    "bulk_sync=1,email_lookup=5,membership_add=3,membership_remove=2,"
+    "group_panel_add=1,group_panel_remove=1,groups_refresh=1"
+)
+
+# Statuses returned when a fallback path is not routed; the plugin simply
+# moves on to the next candidate, so they are not counted as errors.
+FALLBACK_STATUSES = {404, 405}
+
+# Scenario outcomes the plugin treats as done; anything else is a failure.
+SUCCESS_OUTCOMES = {"ok", "duplicate", "missing"}
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """Return the nearest-rank percentile of ``values`` (``0.0`` when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[rank]
+
+
+def _failure_rate(outcomes: Dict[str, int]) -> float:
+    """Share of scenario runs whose outcome is not in ``SUCCESS_OUTCOMES``."""
+    total = sum(outcomes.values())
+    if not total:
+        return 0.0
+    failed = sum(count for outcome, count in outcomes.items() if outcome not in SUCCESS_OUTCOMES)
+    return round(failed / total, 4)
+
+
+def _summarize(values: List[float]) -> Dict[str, float]:
+    """Build the latency summary (in milliseconds) used throughout the report."""
+    return {
+        "count": len(values),
+        "p50_ms": round(_percentile(values, 50) * 1000, 2),
+        "p95_ms": round(_percentile(values, 95) * 1000, 2),
+        "p99_ms": round(_percentile(values, 99) * 1000, 2),
+        "max_ms": round(max(values) * 1000, 2) if values else 0.0,
+    }
+
+
+def _parse_mix(raw: str) -> Dict[str, float]:
+    """Parse ``name=weight`` pairs separated by commas."""
+    mix: Dict[str, float] = {}
+    for chunk in raw.split(","):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        name, _, weight = chunk.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(
+                f"Escenario desconocido '{name}'. Opciones: {', '.join(sorted(SCENARIOS))}"
+            )
+        try:
+            mix[name] = float(weight) if weight else 1.0
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(f"Peso inválido para '{name}': {weight}") from exc
+        if not math.isfinite(mix[name]):
+            raise argparse.ArgumentTypeError(f"El peso de '{name}' debe ser un número finito")
+        if mix[name] < 0:
+            raise argparse.ArgumentTypeError(f"El peso de '{name}' no puede ser negativo")
+
+    if not any(weight > 0 for weight in mix.values()):
+        raise argparse.ArgumentTypeError("La mezcla debe tener al menos un peso positivo")
+    return mix
+
+
+# ---------------------------------------------------------------------------
+# Fixture and application
+# ---------------------------------------------------------------------------
+
+
+def build_dataset(group_count: int, user_count: int) -> Dict[str, list]:
+    """Return the synthetic users and groups the scenarios pick from."""
+    users = [
+        {
+            "id": f"owui-{index:06d}",
+            "username": f"alumno{index}",
+            "email": f"alumno{index}@example.com",
+            "name": f"Alumno {index}",
+        }
+        for index in range(1, user_count + 1)
+    ]
+    groups = [{"id": index, "name": f"Curso {index}"} for index in range(1, group_count + 1)]
+    return {"users": users, "groups": groups}
+
+
+def seed_fixture(db_path: Path, dataset: Dict[str, list], rng: random.Random) -> None:
+    """Create the SQLite fixture from ``dataset``."""
+    users = dataset["users"]
+    groups = dataset["groups"]
+
+    with sqlite3.connect(db_path) as connection:
+        cursor = connection.cursor()
+        cursor.execute("CREATE TABLE users (id TEXT PRIMARY KEY, email TEXT, name TEXT)")
+        cursor.execute("CREATE TABLE groups (id INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+        cursor.execute("CREATE TABLE group_members (group_id INTEGER, user_id TEXT)")
+        cursor.executemany(
+            "INSERT INTO users (id, email, name) VALUES (?, ?, ?)",
+            [(user["id"], user["email"], user["name"]) for user in users],
+        )
+        cursor.executemany(
+            "INSERT INTO groups (id, name) VALUES (?, ?)",
+            [(group["id"], group["name"]) for group in groups],
+        )
+        memberships = []
+        for user in users:
+            for group in rng.sample(groups, k=min(len(groups), rng.randint(1, 3))):
+                memberships.append((group["id"], user["id"]))
+        cursor.executemany(
+            "INSERT INTO group_members (group_id, user_id) VALUES (?, ?)", memberships
+        )
+        connection.commit()
+
+
+class _StubJWTBearer:
+    """Accept every request; stands in for OpenWebUI's ``JWTBearer``."""
+
+    async def __call__(self) -> Dict[str, str]:
+        return {"id": "loadtest", "role": "admin"}
+
+
+def _install_auth_stub() -> None:
+    """Expose ``backend.auth.jwt.JWTBearer`` so ``routes.groups`` imports cleanly."""
+    package = types.ModuleType("backend")
+    package.__path__ = []  # type: ignore[attr-defined]
+    auth = types.ModuleType("backend.auth")
+    auth.__path__ = []  # type: ignore[attr-defined]
+    jwt = types.ModuleType("backend.auth.jwt")
+    jwt.JWTBearer = _StubJWTBearer  # type: ignore[attr-defined]
+    package.auth = auth  # type: ignore[attr-defined]
+    auth.jwt = jwt  # type: ignore[attr-defined]
+    sys.modules["backend"] = package
+    sys.modules["backend.auth"] = auth
+    sys.modules["backend.auth.jwt"] = jwt
+
+
+def load_app(db_path: Path) -> Any:
+    """Import ``app.backend.main`` with auth stubbed and point it at ``db_path``."""
+    _install_auth_stub()
+    os.environ["ENABLE_GROUPS_API"] = "true"
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    from app.backend import main as backend_main  # pylint: disable=import-outside-toplevel
+    from routes import groups  # pylint: disable=import-outside-toplevel
+
+    groups.ENABLE_GROUPS_API = True
+    groups.DB_PATH = db_path
+    groups.JSON_FALLBACK_PATH = db_path.with_name("groups.json")
+    return backend_main.app
+
+
+class _LagProbeApp:
+    """ASGI wrapper that samples the event-loop lag of the worker serving it.
+
+    The probe starts with the first ASGI call (the lifespan startup) and
+    appends ``<wall time> <lag seconds>`` lines to ``lag-<pid>.log`` so the
+    load generator can read them back once the run is over.
+    """
+
+    def __init__(self, app: Any, interval: float, lag_dir: Path) -> None:
+        self.app = app
+        self._interval = interval
+        self._lag_file = lag_dir / f"lag-{os.getpid()}.log"
+        self._probe: Optional[asyncio.Task] = None
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if self._probe is None:
+            self._probe = asyncio.get_running_loop().create_task(self._sample())
+        await self.app(scope, receive, send)
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lag_file.open("a", encoding="utf-8", buffering=1) as file_pointer:
+            while True:
+                started = loop.time()
+                await asyncio.sleep(self._interval)
+                lag = max(0.0, loop.time() - started - self._interval)
+                file_pointer.write(f"{time.time():.6f} {lag:.6f}\n")
+
+
+def _bind_socket() -> socket.socket:
+    # asyncio only enables TCP_NODELAY on sockets created with IPPROTO_TCP;
+    # without it Nagle plus delayed ACK adds ~40 ms to every response.
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _serve_worker(sock: socket.socket, db_path: str, lag_interval: float, lag_dir: str) -> None:
+    """Entry point of every uvicorn worker process."""
+    app = _LagProbeApp(load_app(Path(db_path)), lag_interval, Path(lag_dir))
+    config = uvicorn.Config(
+        app,
+        log_level="warning",
+        access_log=False,
+        timeout_keep_alive=PLUGIN_API_TIMEOUT,
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def serve(args: argparse.Namespace) -> int:
+    """Internal ``--serve`` mode: bind a socket, print its port and run the workers."""
+    sock = _bind_socket()
+    print(sock.getsockname()[1], flush=True)
+
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(
+            target=_serve_worker,
+            args=(sock, str(args.db_path), args.lag_interval, str(args.lag_dir)),
+            name=f"loadtest-worker-{index}",
+        )
+        for index in range(args.workers)
+    ]
+    for worker in workers:
+        worker.start()
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    while not stop.is_set() and all(worker.is_alive() for worker in workers):
+        stop.wait(0.2)
+
+    for worker in workers:
+        worker.terminate()
+    for worker in workers:
+        worker.join(timeout=10.0)
+    sock.close()
+    return 0
+
+
+class ServerProcess:
+    """Run the backend under uvicorn in a separate process tree.
+
+    Keeping the server out of the load generator's interpreter means the
+    client's httpx/JSON work does not compete for the same GIL, and
+    ``--workers`` shows how capacity scales with additional processes.
+    """
+
+    def __init__(self, db_path: Path, lag_dir: Path, workers: int, lag_interval: float) -> None:
+        self._lag_dir = lag_dir
+        self._workers = workers
+        self._command = [
+            sys.executable,
+            str(Path(__file__).resolve()),
+            "--serve",
+            "--db-path",
+            str(db_path),
+            "--lag-dir",
+            str(lag_dir),
+            "--workers",
+            str(workers),
+            "--lag-interval",
+            str(lag_interval),
+        ]
+        self._process: Optional[subprocess.Popen] = None
+        self.port = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self, timeout: float = 30.0) -> None:
+        # Own session so ``stop`` can signal the supervisor and its workers together.
+        self._process = subprocess.Popen(  # pylint: disable=consider-using-with
+            self._command,
+            cwd=REPO_ROOT,
+            stdout=subprocess.PIPE,
+            text=True,
+            start_new_session=True,
+        )
+        port_line = self._process.stdout.readline() if self._process.stdout else ""
+        if not port_line.strip().isdigit():
+            self.stop()
+            raise RuntimeError("El servidor de pruebas no informó su puerto")
+        self.port = int(port_line)
+
+        # Every worker creates its lag file once its lifespan startup runs.
+        deadline = time.monotonic() + timeout
+        while len(list(self._lag_dir.glob("lag-*.log"))) < self._workers:
+            if self._process.poll() is not None or time.monotonic() > deadline:
+                self.stop()
+                raise RuntimeError("Los workers de uvicorn no arrancaron a tiempo")
+            time.sleep(0.05)
+
+    def lag_samples(self, since: float, until: float) -> List[float]:
+        """Return lag samples recorded by all workers between two wall times."""
+        samples: List[float] = []
+        for lag_file in self._lag_dir.glob("lag-*.log"):
+            for line in lag_file.read_text(encoding="utf-8").splitlines():
+                try:
+                    stamp, lag = (float(value) for value in line.split())
+                except ValueError:
+                    continue
+                if since <= stamp <= until:
+                    samples.append(lag)
+        return samples
+
+    def stop(self) -> None:
+        if self._process is None:
+            return
+        if self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=15.0)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+        # Workers outlive a supervisor that was killed or crashed; reap them too.
+        try:
+            os.killpg(self._process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        if self._process.stdout:
+            self._process.stdout.close()
+
+
+# ---------------------------------------------------------------------------
+# Traffic replay
+# ---------------------------------------------------------------------------
+
+
+class LoadStats:
+    """Collect per-request and per-scenario measurements."""
+
+    def __init__(self) -> None:
+        self.endpoint_latencies: Dict[str, List[float]] = {}
+        self.status_counts: Dict[str, int] = {}
+        self.scenario_latencies: Dict[str, List[float]] = {}
+        self.scenario_outcomes: Dict[str, Dict[str, int]] = {}
+        self.requests = 0
+        self.fallbacks = 0
+        self.client_errors = 0
+        self.errors = 0
+
+    def record_request(self, label: str, elapsed: float, status: Optional[int]) -> None:
+        self.requests += 1
+        self.endpoint_latencies.setdefault(label, []).append(elapsed)
+        key = str(status) if status is not None else "transport_error"
+        self.status_counts[key] = self.status_counts.get(key, 0) + 1
+        if status is None or status >= 500:
+            self.errors += 1
+        elif status in FALLBACK_STATUSES:
+            self.fallbacks += 1
+        elif status >= 400:
+            self.client_errors += 1
+
+    def record_scenario(self, name: str, elapsed: float, outcome: str) -> None:
+        self.scenario_latencies.setdefault(name, []).append(elapsed)
+        outcomes = self.scenario_outcomes.setdefault(name, {})
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+
+class PluginState:
+    """WordPress-side state every simulated plugin request shares.
+
+    ``remote_user_ids`` stands in for the ``_openwebui_user_id`` user meta
+    (only successful lookups are stored) and ``groups_cache`` for the
+    ``openwebui_groups_cache`` option (``None`` until the first refresh).
+    ``unresolved`` holds emails whose lookup failed so membership scenarios
+    only target users that can actually be written.
+    """
+
+    def __init__(self, remote_user_ids: Optional[Dict[str, Any]] = None) -> None:
+        self.remote_user_ids: Dict[str, Any] = dict(remote_user_ids or {})
+        self.groups_cache: Optional[List[Dict[str, Any]]] = None
+        self.unresolved: set = set()
+
+
+class ReplayContext:
+    """Per-client view of the shared HTTP client, stats and plugin state."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        stats: LoadStats,
+        state: PluginState,
+        fixture: Dict[str, list],
+        rng: random.Random,
+        bulk_size: int,
+        panel_size: int,
+        plugin_pacing: bool,
+    ) -> None:
+        self.client = client
+        self.stats = stats
+        self.state = state
+        self.users = fixture["users"]
+        self.groups = fixture["groups"]
+        self.rng = rng
+        self.bulk_size = bulk_size
+        self.panel_size = panel_size
+        self.plugin_pacing = plugin_pacing
+
+    def pick_users(self, count: int) -> List[Dict[str, str]]:
+        """Pick membership targets, skipping users whose lookup already failed."""
+        candidates = [
+            user
+            for user in self.users
+            if user["email"] in self.state.remote_user_ids
+            or user["email"] not in self.state.unresolved
+        ]
+        if not candidates:
+            return []
+        return self.rng.sample(candidates, k=min(count, len(candidates)))
+
+    async def call(
+        self, method: str, template: str, path: str, payload: Optional[dict] = None
+    ) -> Tuple[Optional[int], str]:
+        """Issue one request, record it under ``template`` and return status/body."""
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, json=payload)
+        except httpx.HTTPError as exc:
+            self.stats.record_request(f"{method} {template}", time.perf_counter() - started, None)
+            return None, str(exc)
+        self.stats.record_request(
+            f"{method} {template}", time.perf_counter() - started, response.status_code
+        )
+        return response.status_code, response.text
+
+
+def _is_duplicate(status: Optional[int], body: str) -> bool:
+    """Mirror ``is_duplicate_group_message`` on the plugin's ``HTTP %d: ...`` message."""
+    message = f"HTTP {status}: {body[:100]}".lower()
+    return any(keyword in message for keyword in DUPLICATE_KEYWORDS)
+
+
+def _is_success(status: Optional[int]) -> bool:
+    return status is not None and 200 <= status < 300
+
+
+def _resolve_user_id(node: Any) -> Any:
+    """Mirror ``resolve_user_id_from_node``: first non-empty id-like field."""
+    if not isinstance(node, dict):
+        return None
+    for field in ("id", "_id", "userId", "uuid"):
+        value = node.get(field)
+        if value is not None and str(value).strip() != "":
+            return value
+    return None
+
+
+def _extract_user_id(payload: Any) -> Any:
+    """Mirror ``extract_user_from_payload`` and return the resolved user id."""
+    if isinstance(payload, dict):
+        user_id = _resolve_user_id(payload)
+        if user_id:
+            return user_id
+        for key in ("data", "user", "users", "items", "results"):
+            if key in payload:
+                user_id = _extract_user_id(payload[key])
+                if user_id:
+                    return user_id
+    elif isinstance(payload, list):
+        for value in payload:
+            user_id = _extract_user_id(value)
+            if user_id:
+                return user_id
+    return None
+
+
+def _groups_from_payload(payload: Any) -> Optional[List[Dict[str, Any]]]:
+    """Extract ``{id, name}`` groups from a groups response (``None`` if unusable)."""
+    groups = payload.get("groups", payload.get("data")) if isinstance(payload, dict) else payload
+    if not isinstance(groups, list):
+        return None
+    return [
+        {"id": group["id"], "name": str(group.get("name", ""))}
+        for group in groups
+        if isinstance(group, dict) and group.get("id") not in (None, "")
+    ]
+
+
+async def _lookup_user_by_email(ctx: ReplayContext, email: str) -> Any:
+    """Replay ``get_openwebui_user_id_by_email`` and return the remote id or ``None``."""
+    for template in EMAIL_LOOKUP_ENDPOINTS:
+        status, body = await ctx.call("GET", template, template.format(email=quote(email, safe="")))
+        if not _is_success(status):
+            continue
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            continue
+        user_id = _extract_user_id(payload)
+        if user_id:
+            return user_id
+    return None
+
+
+async def _remote_user_id(ctx: ReplayContext, email: str) -> Any:
+    """Use the cached ``_openwebui_user_id`` meta or resolve and store it."""
+    user_id = ctx.state.remote_user_ids.get(email)
+    if user_id:
+        return user_id
+    user_id = await _lookup_user_by_email(ctx, email)
+    if user_id:
+        ctx.state.remote_user_ids[email] = user_id
+    else:
+        ctx.state.unresolved.add(email)
+    return user_id
+
+
+async def _refresh_groups_cache(ctx: ReplayContext) -> Optional[List[Dict[str, Any]]]:
+    """Replay ``fetch_openwebui_groups_from_api`` and update the shared cache."""
+    empty_response = False
+    for endpoint in GROUPS_ENDPOINTS:
+        status, body = await ctx.call("GET", endpoint, endpoint)
+        if not _is_success(status):
+            continue
+        try:
+            groups = _groups_from_payload(json.loads(body))
+        except ValueError:
+            continue
+        if groups:
+            ctx.state.groups_cache = groups
+            return groups
+        if groups is not None:
+            empty_response = True
+    if empty_response:
+        ctx.state.groups_cache = []
+        return []
+    return None
+
+
+def _find_cached_group(ctx: ReplayContext, name: str) -> Optional[Dict[str, Any]]:
+    for group in ctx.state.groups_cache or []:
+        if group["name"].lower() == name.lower():
+            return group
+    return None
+
+
+async def _group_by_name(ctx: ReplayContext, name: str, create_if_missing: bool) -> Tuple[bool, Any]:
+    """Replay ``get_openwebui_group_by_name``; returns ``(success, group or None)``."""
+    group = _find_cached_group(ctx, name)
+    if group:
+        return True, group
+    if await _refresh_groups_cache(ctx) is None:
+        return False, None
+    group = _find_cached_group(ctx, name)
+    if group or not create_if_missing:
+        return True, group
+
+    created = False
+    for endpoint in GROUPS_ENDPOINTS:
+        for payload in ({"name": name}, {"title": name}, {"group": {"name": name}}):
+            status, _ = await ctx.call("POST", endpoint, endpoint, payload)
+            if _is_success(status):
+                created = True
+                break
+        if created:
+            break
+    if not created or await _refresh_groups_cache(ctx) is None:
+        return False, None
+    group = _find_cached_group(ctx, name)
+    return group is not None, group
+
+
+async def _pace_panel(ctx: ReplayContext, handled: int) -> None:
+    """``sleep(1)`` every five handled users, as the group panel handlers do."""
+    if ctx.plugin_pacing and handled % 5 == 0:
+        await asyncio.sleep(1)
+
+
+async def scenario_bulk_sync(ctx: ReplayContext) -> str:
+    users = ctx.rng.sample(ctx.users, k=min(ctx.bulk_size, len(ctx.users)))
+    errors = 0
+    for processed, user in enumerate(users, start=1):
+        payload = {
+            "username": user["username"],
+            "email": user["email"],
+            "password": "loadtest-password",
+            "name": user["name"],
+        }
+        synced = False
+        for endpoint in SIGNUP_ENDPOINTS:
+            status, body = await ctx.call("POST", endpoint, endpoint, payload)
+            lowered = f"HTTP {status}: {body[:100]}".lower()
+            if _is_success(status) or any(
+                marker in lowered for marker in ("already exists", "409", "duplicate")
+            ):
+                synced = True
+                break
+        if not synced:
+            errors += 1
+        if ctx.plugin_pacing and processed % 3 == 0 and processed < len(users):
+            await asyncio.sleep(1)
+        if errors > 5:
+            return "aborted"
+    return "ok" if errors == 0 else "partial"
+
+
+async def scenario_email_lookup(ctx: ReplayContext) -> str:
+    user = ctx.rng.choice(ctx.users)
+    return "ok" if await _lookup_user_by_email(ctx, user["email"]) else "not_found"
+
+
+async def scenario_membership_add(ctx: ReplayContext) -> str:
+    """Replay ``handle_ld_added_group_access``."""
+    users = ctx.pick_users(1)
+    if not users:
+        return "no_remote_user"
+    user_id = await _remote_user_id(ctx, users[0]["email"])
+    if not user_id:
+        return "no_remote_user"
+    found, group = await _group_by_name(ctx, ctx.rng.choice(ctx.groups)["name"], True)
+    if not found or not group:
+        return "group_unavailable"
+
+    payloads = (
+        {"userId": user_id},
+        {"user_id": user_id},
+        {"userIds": [user_id]},
+        {"users": [user_id]},
+        {"members": [{"userId": user_id}]},
+    )
+    for template in MEMBERSHIP_ADD_ENDPOINTS:
+        path = template.format(group_id=quote(str(group["id"]), safe=""))
+        for payload in payloads:
+            status, body = await ctx.call("POST", template, path, payload)
+            if _is_success(status):
+                return "ok"
+            if _is_duplicate(status, body):
+                return "duplicate"
+    return "failed"
+
+
+async def scenario_membership_remove(ctx: ReplayContext) -> str:
+    """Replay ``handle_ld_removed_group_access``."""
+    users = ctx.pick_users(1)
+    if not users:
+        return "no_remote_user"
+    user_id = await _remote_user_id(ctx, users[0]["email"])
+    if not user_id:
+        return "no_remote_user"
+    found, group = await _group_by_name(ctx, ctx.rng.choice(ctx.groups)["name"], False)
+    if not found:
+        return "group_unavailable"
+    if not group:
+        return "missing"
+
+    for template in MEMBERSHIP_REMOVE_ENDPOINTS:
+        path = template.format(
+            group_id=quote(str(group["id"]), safe=""), user_id=quote(str(user_id), safe="")
+        )
+        status, _ = await ctx.call("DELETE", template, path)
+        if _is_success(status):
+            return "ok"
+        if status == 404:
+            return "missing"
+    return "failed"
+
+
+async def scenario_group_panel_add(ctx: ReplayContext) -> str:
+    """Replay ``assign_group_members_ajax`` -> ``add_user_to_group`` per user."""
+    if not ctx.state.groups_cache:
+        return "no_group_cache"
+    group = ctx.rng.choice(ctx.state.groups_cache)
+    users = ctx.pick_users(ctx.panel_size)
+    errors = 0
+    for handled, user in enumerate(users, start=1):
+        email, username = user["email"], user["username"]
+        payloads = (
+            {"email": email},
+            {"user_email": email},
+            {"emails": [email]},
+            {"user": {"email": email}},
+            {"members": [{"email": email}]},
+            {"username": username},
+            {"usernames": [username]},
+            {"user": {"username": username}},
+            {"user": {"email": email, "username": username}},
+        )
+        done = False
+        for template in GROUP_PANEL_ADD_ENDPOINTS:
+            path = template.format(group_id=quote(str(group["id"]), safe=""))
+            for payload in payloads:
+                status, body = await ctx.call("POST", template, path, payload)
+                if _is_success(status) or _is_duplicate(status, body):
+                    done = True
+                    break
+            if done:
+                break
+        if not done:
+            errors += 1
+        await _pace_panel(ctx, handled)
+    if not users or errors == len(users):
+        return "failed"
+    return "ok" if errors == 0 else "partial"
+
+
+async def scenario_group_panel_remove(ctx: ReplayContext) -> str:
+    """Replay ``remove_group_members_ajax`` -> ``remove_user_from_group`` per user."""
+    if not ctx.state.groups_cache:
+        return "no_group_cache"
+    group = ctx.rng.choice(ctx.state.groups_cache)
+    users = ctx.pick_users(ctx.panel_size)
+    errors = 0
+    removals = 0
+    for handled, user in enumerate(users, start=1):
+        # ``remove_user_from_group`` only uses the per-request lookup cache.
+        user_id = await _lookup_user_by_email(ctx, user["email"])
+        if user_id:
+            removed = False
+            for template in GROUP_PANEL_REMOVE_ENDPOINTS:
+                path = template.format(
+                    group_id=quote(str(group["id"]), safe=""), user_id=quote(str(user_id), safe="")
+                )
+                status, _ = await ctx.call("DELETE", template, path)
+                if _is_success(status) or status == 404:
+                    removed = True
+                    break
+            if removed:
+                removals += 1
+            else:
+                errors += 1
+        else:
+            ctx.state.unresolved.add(user["email"])
+        await _pace_panel(ctx, handled)
+    if users and errors == len(users):
+        return "failed"
+    if errors:
+        return "partial"
+    # Users the lookup could not resolve end as ``missing`` in the plugin.
+    return "ok" if removals else "missing"
+
+
+async def scenario_groups_refresh(ctx: ReplayContext) -> str:
+    """Replay ``sync_openwebui_groups_ajax``, which rewrites the groups cache."""
+    groups = await _refresh_groups_cache(ctx)
+    if groups is None:
+        return "failed"
+    return "ok" if groups else "empty"
+
+
+SCENARIOS: Dict[str, Callable[[ReplayContext], Any]] = {
+    "bulk_sync": scenario_bulk_sync,
+    "email_lookup": scenario_email_lookup,
+    "membership_add": scenario_membership_add,
+    "membership_remove": scenario_membership_remove,
+    "group_panel_add": scenario_group_panel_add,
+    "group_panel_remove": scenario_group_panel_remove,
+    "groups_refresh": scenario_groups_refresh,
+}
+
+
+async def _discover(client: httpx.AsyncClient, endpoints: Tuple[str, ...], parse: Callable) -> list:
+    """Return the first non-empty list ``parse`` extracts from ``endpoints``."""
+    for endpoint in endpoints:
+        try:
+            response = await client.get(endpoint)
+            payload = response.json()
+        except (httpx.HTTPError, ValueError):
+            continue
+        if 200 <= response.status_code < 300:
+            found = parse(payload)
+            if found:
+                return found
+    return []
+
+
+def _users_from_payload(payload: Any) -> List[Dict[str, str]]:
+    """Extract users with an email from a user listing (``bilateral_sync_ajax`` style)."""
+    users = payload
+    if isinstance(payload, dict):
+        users = next(
+            (payload[key] for key in ("users", "data", "items", "results") if isinstance(payload.get(key), list)),
+            [],
+        )
+    if not isinstance(users, list):
+        return []
+    found = []
+    for node in users:
+        if isinstance(node, dict) and node.get("email"):
+            email = str(node["email"])
+            found.append(
+                {
+                    "id": str(_resolve_user_id(node) or ""),
+                    "email": email,
+                    "username": str(node.get("username") or email.split("@")[0]),
+                    "name": str(node.get("name") or email),
+                }
+            )
+    return found
+
+
+async def _client_loop(ctx: ReplayContext, mix: Dict[str, float], deadline: float) -> None:
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    while time.perf_counter() < deadline:
+        name = ctx.rng.choices(names, weights)[0]
+        started = time.perf_counter()
+        outcome = await SCENARIOS[name](ctx)
+        ctx.stats.record_scenario(name, time.perf_counter() - started, outcome)
+
+
+async def run_load(
+    base_url: str,
+    fixture: Dict[str, list],
+    state: PluginState,
+    mix: Dict[str, float],
+    concurrency: int,
+    duration: float,
+    seed: int,
+    bulk_size: int,
+    panel_size: int,
+    plugin_pacing: bool,
+    lag_interval: float,
+    keep_alive: bool = False,
+    api_key: Optional[str] = None,
+    discover: bool = False,
+) -> Tuple[LoadStats, float, List[float]]:
+    """Replay the scenario mix with ``concurrency`` clients for ``duration`` seconds.
+
+    Also returns the lag of the generator's own event loop: when it grows the
+    client, not the server, is the bottleneck and latencies are inflated.
+    """
+    stats = LoadStats()
+    client_lag: List[float] = []
+
+    async def _probe_client_lag() -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(lag_interval)
+            client_lag.append(max(0.0, loop.time() - started - lag_interval))
+
+    probe = asyncio.create_task(_probe_client_lag())
+    # Each ``wp_remote_*`` call in the plugin opens its own connection, so by
+    # default nothing is pooled and connect/accept cost stays in the numbers.
+    limits = httpx.Limits(
+        max_connections=concurrency,
+        max_keepalive_connections=concurrency if keep_alive else 0,
+    )
+    headers = {"Accept": "application/json"}
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+    async with httpx.AsyncClient(
+        base_url=base_url, timeout=PLUGIN_API_TIMEOUT, limits=limits, headers=headers
+    ) as client:
+        if discover:
+            # Target real groups and users so membership writes hit existing rows.
+            groups = await _discover(client, GROUPS_ENDPOINTS, _groups_from_payload)
+            users = await _discover(client, USER_LIST_ENDPOINTS, _users_from_payload)
+            fixture = {
+                "groups": groups or fixture["groups"],
+                "users": users or fixture["users"],
+            }
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(
+            *(
+                _client_loop(
+                    ReplayContext(
+                        client,
+                        stats,
+                        state,
+                        fixture,
+                        random.Random(seed + index),
+                        bulk_size,
+                        panel_size,
+                        plugin_pacing,
+                    ),
+                    mix,
+                    deadline,
+                )
+                for index in range(concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - started
+    probe.cancel()
+    return stats, elapsed, client_lag
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+
+def build_report(
+    stats: LoadStats,
+    elapsed: float,
+    lag_samples: List[float],
+    client_lag: List[float],
+    args: argparse.Namespace,
+    notes: List[str],
+) -> Dict[str, Any]:
+    requests = stats.requests or 1
+    all_outcomes: Dict[str, int] = {}
+    for outcomes in stats.scenario_outcomes.values():
+        for outcome, count in outcomes.items():
+            all_outcomes[outcome] = all_outcomes.get(outcome, 0) + count
+    return {
+        "config": {
+            "target": args.base_url or "local",
+            "concurrency": args.concurrency,
+            "keep_alive": args.keep_alive,
+            "workers": args.workers,
+            "duration_s": args.duration,
+            "mix": args.mix,
+            "bulk_size": args.bulk_size,
+            "panel_size": args.panel_size,
+            "cached_id_ratio": args.cached_id_ratio,
+            "plugin_pacing": args.plugin_pacing,
+            "users": args.users,
+            "groups": args.groups,
+        },
+        "elapsed_s": round(elapsed, 2),
+        "requests": stats.requests,
+        "throughput_rps": round(stats.requests / elapsed, 2) if elapsed else 0.0,
+        "error_rate": round(stats.errors / requests, 4),
+        "client_error_rate": round(stats.client_errors / requests, 4),
+        "fallback_rate": round(stats.fallbacks / requests, 4),
+        "scenario_failure_rate": _failure_rate(all_outcomes),
+        "status_counts": dict(sorted(stats.status_counts.items())),
+        "event_loop_lag": _summarize(lag_samples) if lag_samples else None,
+        "client_loop_lag": _summarize(client_lag),
+        "scenarios": {
+            name: {
+                **_summarize(values),
+                "failure_rate": _failure_rate(stats.scenario_outcomes.get(name, {})),
+                "outcomes": stats.scenario_outcomes.get(name, {}),
+            }
+            for name, values in sorted(stats.scenario_latencies.items())
+        },
+        "endpoints": {
+            label: _summarize(values)
+            for label, values in sorted(stats.endpoint_latencies.items())
+        },
+        "notes": notes,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print("=" * 70)
+    print("RESULTADOS: tráfico del plugin de WordPress")
+    print("=" * 70)
+    print(f"Destino: {report['config']['target']}")
+    print(
+        f"Peticiones: {report['requests']} en {report['elapsed_s']}s "
+        f"({report['throughput_rps']} req/s)"
+    )
+    print(
+        f"Errores (5xx/transporte): {report['error_rate']:.2%}  "
+        f"Otros 4xx: {report['client_error_rate']:.2%}  "
+        f"Fallback 404/405: {report['fallback_rate']:.2%}"
+    )
+    print(f"Escenarios fallidos: {report['scenario_failure_rate']:.2%}")
+    print(f"Códigos HTTP: {report['status_counts']}")
+
+    lag = report["event_loop_lag"]
+    if lag is None:
+        print("Lag del event loop del servidor: no medido (servidor remoto)")
+    else:
+        print(
+            f"Lag del event loop del servidor (ms, {report['config']['workers']} worker/s): "
+            f"p50={lag['p50_ms']} p95={lag['p95_ms']} p99={lag['p99_ms']} max={lag['max_ms']}"
+        )
+    lag = report["client_loop_lag"]
+    print(
+        f"Lag del event loop del generador (ms): p50={lag['p50_ms']} p95={lag['p95_ms']} "
+        f"p99={lag['p99_ms']} max={lag['max_ms']}"
+    )
+    for note in report["notes"]:
+        print(f"Nota: {note}")
+
+    header = f"{'':<48}{'n':>8}{'p50':>10}{'p95':>10}{'p99':>10}"
+    print("\nEscenarios (ms)")
+    print(f"{header}{'fallos':>10}")
+    for name, summary in report["scenarios"].items():
+        print(
+            f"{name:<48}{summary['count']:>8}{summary['p50_ms']:>10}"
+            f"{summary['p95_ms']:>10}{summary['p99_ms']:>10}"
+            f"{summary['failure_rate']:>10.1%}"
+        )
+        print(f"{'':<4}resultados: {summary['outcomes']}")
+
+    print("\nEndpoints (ms)")
+    print(header)
+    for label, summary in report["endpoints"].items():
+        print(
+            f"{label:<48}{summary['count']:>8}{summary['p50_ms']:>10}"
+            f"{summary['p95_ms']:>10}{summary['p99_ms']:>10}"
+        )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", help="Atacar una instancia de OpenWebUI existente en lugar del backend local (bulk_sync crea cuentas reales: usa staging)")
+    parser.add_argument("--api-key", default=os.getenv("OPENWEBUI_API_KEY"), help="Token Bearer para --base-url (por defecto: $OPENWEBUI_API_KEY)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Clientes simultáneos del plugin")
+    parser.add_argument("--workers", type=int, default=1, help="Procesos worker de uvicorn del servidor")
+    parser.add_argument("--duration", type=float, default=30.0, help="Duración de la prueba en segundos")
+    parser.add_argument("--mix", type=_parse_mix, default=DEFAULT_MIX, help=f"Pesos por escenario (por defecto: {DEFAULT_MIX})")
+    parser.add_argument("--users", type=int, default=500, help="Usuarios sembrados en el fixture")
+    parser.add_argument("--groups", type=int, default=20, help="Grupos sembrados en el fixture")
+    parser.add_argument("--bulk-size", type=int, default=25, help="Usuarios por ejecución de bulk_sync")
+    parser.add_argument("--panel-size", type=int, default=10, help="Usuarios por ejecución del panel de grupos")
+    parser.add_argument("--cached-id-ratio", type=float, default=0.9, help="Fracción de usuarios locales con _openwebui_user_id ya guardado")
+    parser.add_argument("--keep-alive", action="store_true", help="Reutilizar conexiones (el plugin abre una conexión nueva por petición)")
+    parser.add_argument("--plugin-pacing", action="store_true", help="Respetar las pausas de sleep(1) del plugin en bulk_sync y el panel de grupos")
+    parser.add_argument("--lag-interval", type=float, default=0.01, help="Intervalo del muestreo de lag en segundos")
+    parser.add_argument("--seed", type=int, default=1, help="Semilla para reproducir la mezcla")
+    parser.add_argument("--json-output", type=Path, help="Guardar el informe en este archivo JSON")
+    # Internal options used when the script re-launches itself as the server.
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--db-path", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--lag-dir", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if min(args.concurrency, args.workers, args.users, args.groups, args.bulk_size, args.panel_size) < 1:
+        parser.error(
+            "--concurrency, --workers, --users, --groups, --bulk-size y --panel-size deben ser >= 1"
+        )
+    if not 0 <= args.cached_id_ratio <= 1:
+        parser.error("--cached-id-ratio debe estar entre 0 y 1")
+    if args.duration <= 0 or args.lag_interval <= 0:
+        parser.error("--duration y --lag-interval deben ser > 0")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.serve:
+        return serve(args)
+
+    dataset = build_dataset(args.groups, args.users)
+    load_kwargs = {
+        "fixture": dataset,
+        "mix": args.mix,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "seed": args.seed,
+        "bulk_size": args.bulk_size,
+        "panel_size": args.panel_size,
+        "plugin_pacing": args.plugin_pacing,
+        "lag_interval": args.lag_interval,
+        "keep_alive": args.keep_alive,
+    }
+    notes = [
+        "el generador comparte la CPU de esta máquina; si su lag crece, las "
+        "latencias incluyen saturación del cliente.",
+        "conexiones reutilizadas (--keep-alive): las latencias no incluyen el coste "
+        "de conexión que paga el plugin en cada petición."
+        if args.keep_alive
+        else "una conexión TCP nueva por petición, como wp_remote_* en el plugin.",
+    ]
+
+    if args.base_url:
+        stats, elapsed, client_lag = asyncio.run(
+            run_load(
+                args.base_url,
+                state=PluginState(),
+                api_key=args.api_key,
+                discover=True,
+                **load_kwargs,
+            )
+        )
+        lag_samples: List[float] = []
+    else:
+        notes.insert(0, LOCAL_TARGET_NOTE)
+        with tempfile.TemporaryDirectory(prefix="owui-loadtest-") as tmp_dir:
+            db_path = Path(tmp_dir) / "db.sqlite3"
+            lag_dir = Path(tmp_dir) / "lag"
+            lag_dir.mkdir()
+            seed_fixture(db_path, dataset, random.Random(args.seed))
+            server = ServerProcess(db_path, lag_dir, args.workers, args.lag_interval)
+            server.start()
+            try:
+                load_started = time.time()
+                cached = random.Random(args.seed).sample(
+                    dataset["users"], k=round(len(dataset["users"]) * args.cached_id_ratio)
+                )
+                state = PluginState({user["email"]: user["id"] for user in cached})
+                stats, elapsed, client_lag = asyncio.run(
+                    run_load(server.base_url, state=state, **load_kwargs)
+                )
+                lag_samples = server.lag_samples(load_started, time.time())
+            finally:
+                server.stop()
+
+    report = build_report(stats, elapsed, lag_samples, client_lag, args, notes)
+    print_report(report)
+    if args.json_output:
+        args.json_output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\n📄 Informe JSON guardado en: {args.json_output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())